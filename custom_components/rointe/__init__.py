@@ -8,6 +8,7 @@ import logging
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import DOMAIN, PLATFORMS
 from .auth import RointeAuth, RointeRestAuthError, RointeFirebaseAuthError
 from .ws import RointeWebSocket
@@ -21,8 +22,7 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Rointe from a config entry using dual authentication."""
-    _LOGGER.error("🚀🚀🚀 Rointe integration setup STARTING for entry: %s", entry.entry_id)
-    _LOGGER.error("🚀🚀🚀 Entry data: %s", entry.data)
+    _LOGGER.debug("Rointe integration setup starting for entry: %s", entry.entry_id)
     hass.data.setdefault(DOMAIN, {})
     
     try:
@@ -31,13 +31,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         password = entry.data.get("password")
         
         if not email or not password:
-            _LOGGER.error("Missing email or password in config entry data: %s", entry.data)
+            missing = [key for key in ("email", "password") if not entry.data.get(key)]
+            _LOGGER.error("Missing %s in config entry data", ", ".join(missing))
             raise ConfigEntryNotReady("Missing email or password in configuration")
         
         _LOGGER.debug("Setting up Rointe integration for entry %s with email: %s", entry.entry_id, email)
         
-        # Initialize dual authentication system
-        auth = RointeAuth(email, password)
+        # Initialize dual authentication system on HA's shared HTTP session
+        session = async_get_clientsession(hass)
+        auth = RointeAuth(email, password, session=session)
         
         # Test REST API authentication first
         try:
@@ -62,7 +64,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         ws = None
         try:
             if auth.is_firebase_token_valid():
-                ws = RointeWebSocket(hass, auth)
+                ws = RointeWebSocket(hass, auth, session=session)
                 await ws.connect()
                 _LOGGER.info("WebSocket connection established")
             else:
@@ -81,9 +83,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 _LOGGER.warning("No devices discovered")
             else:
                 _LOGGER.info("Discovered %d devices", len(devices))
-                for device in devices:
-                    _LOGGER.debug("Device: %s (%s) in zone %s", 
-                                device.get("id"), device.get("name"), device.get("zone"))
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    for device in devices:
+                        _LOGGER.debug("Device: %s (%s) in zone %s", 
+                                    device.get("id"), device.get("name"), device.get("zone"))
         except (RointeAPIError, RointeNetworkError) as e:
             _LOGGER.error("Device discovery failed: %s", e)
             # Don't fail setup completely - allow partial functionality
@@ -142,13 +145,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         except Exception as e:
             _LOGGER.error("Error disconnecting WebSocket: %s", e)
         
-        try:
-            if "auth" in data and data["auth"]:
-                await data["auth"].close()
-                _LOGGER.debug("Auth session closed")
-        except Exception as e:
-            _LOGGER.error("Error closing auth session: %s", e)
-        
         try:
             if "api" in data and data["api"]:
                 await data["api"].close()
@@ -46,11 +46,11 @@ class RointeFirebaseAuthError(RointeAuthError):
 class RointeAuth:
     """Handles dual authentication for Rointe integration"""
     
-    def __init__(self, email: str, password: str):
-        """Initialize authentication with email and password"""
+    def __init__(self, email: str, password: str, session: aiohttp.ClientSession):
+        """Initialize authentication with email, password and Home Assistant's shared session"""
         self.email = email
         self.password = password
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session = session
         
         # REST API tokens
         self._rest_token: Optional[str] = None
@@ -64,27 +64,6 @@ class RointeAuth:
         
         _LOGGER.debug(f"Initialized RointeAuth for email: {email}")
     
-    async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
-    
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
-    
-    async def close(self):
-        """Close the HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-    
     async def async_login_rest(self) -> bool:
         """
         Login to Rointe REST API and obtain REST token
@@ -95,7 +74,7 @@ class RointeAuth:
         try:
             _LOGGER.debug("Attempting REST API login")
             
-            session = await self._get_session()
+            session = self.session
             
             # Prepare login payload
             login_data = {
@@ -174,7 +153,7 @@ class RointeAuth:
         try:
             _LOGGER.debug("Attempting Firebase login")
             
-            session = await self._get_session()
+            session = self.session
             
             # Firebase uses user_id as email and password
             firebase_email = f"{self._user_id}@rointe.com"
@@ -274,7 +253,7 @@ class RointeAuth:
         try:
             _LOGGER.debug("Refreshing Firebase token")
             
-            session = await self._get_session()
+            session = self.session
             
             # Prepare refresh payload
             refresh_data = {
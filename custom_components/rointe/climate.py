@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Final
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -9,6 +10,7 @@ from homeassistant.components.climate import (
     PRESET_COMFORT,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from .const import DOMAIN
 from .ws import SIGNAL_UPDATE
@@ -16,12 +18,33 @@ from .api import RointeAPI
 
 _LOGGER = logging.getLogger(__name__)
 
-HVAC_MODES = [HVACMode.OFF, HVACMode.HEAT]
-PRESET_MODES = [PRESET_ECO, PRESET_COMFORT]
+HVAC_MODES: Final = (HVACMode.OFF, HVACMode.HEAT)
+PRESET_MODES: Final = (PRESET_ECO, PRESET_COMFORT)
 
 MIN_TEMP = 5.0
 MAX_TEMP = 35.0
 
+# Window for coalescing bursts of WebSocket pushes into one state write
+STATE_WRITE_DELAY = 0.05
+
+_MISSING = object()
+
+
+def _decode_temp(state: dict, key: str) -> Optional[float]:
+    """Return a numeric temperature from a WebSocket payload, if present."""
+    value = state.get(key, _MISSING)
+    if value is _MISSING or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+# WebSocket status -> (hvac_mode, preset_mode, hvac_action)
+_STATUS_MAP = {
+    "comfort": (HVACMode.HEAT, PRESET_COMFORT, HVACAction.HEATING),
+    "eco": (HVACMode.HEAT, PRESET_ECO, HVACAction.HEATING),
+    "ice": (HVACMode.OFF, None, HVACAction.OFF),
+}
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up Rointe climate entities."""
     data = hass.data[DOMAIN][entry.entry_id]
@@ -29,17 +52,31 @@ async def async_setup_entry(hass, entry, async_add_entities):
     api: RointeAPI = data["api"]
     devices = data["devices"]
 
-    entities = []
-    for dev in devices:
-        entity = RointeHeater(hass, ws, api, dev["id"], dev.get("name", "Heater"), dev)
-        entities.append(entity)
+    def _make_entity(dev):
+        return RointeHeater(hass, ws, api, dev["id"], dev.get("name", "Heater"), dev)
 
-    async_add_entities(entities)
+    async_add_entities([_make_entity(dev) for dev in devices])
 
 
 class RointeHeater(ClimateEntity):
     """Representation of a Rointe heater."""
 
+    # Attributes set by this class; the _attr_* names belong to the base classes.
+    # The HA base classes still provide a __dict__, so this speeds up access to
+    # these names rather than shrinking the instance.
+    __slots__ = (
+        "ws",
+        "api",
+        "device_id",
+        "_unsub_dispatcher",
+        "_pending_write_handle",
+        "_mode_known",
+        "_target_known",
+    )
+
+    # State is pushed over the WebSocket, there is nothing to poll
+    _attr_should_poll = False
+
     def __init__(self, hass, ws, api: RointeAPI, device_id: str, name: str, device_info: Optional[Dict[str, Any]]):
         self.hass = hass
         self.ws = ws
@@ -68,33 +105,80 @@ class RointeHeater(ClimateEntity):
         self._attr_preset_mode = PRESET_ECO
         self._attr_hvac_action = HVACAction.OFF
 
-        async_dispatcher_connect(hass, f"{SIGNAL_UPDATE}_{self.device_id}", self._handle_update)
+        self._unsub_dispatcher = None
+        self._pending_write_handle: Optional[asyncio.TimerHandle] = None
+        # The defaults above are placeholders until the device reports its state
+        self._mode_known = False
+        self._target_known = False
+
+    async def async_added_to_hass(self):
+        """Subscribe to WebSocket updates once the entity is registered."""
+        self._unsub_dispatcher = async_dispatcher_connect(
+            self.hass, f"{SIGNAL_UPDATE}_{self.device_id}", self._handle_update
+        )
+
+    async def async_will_remove_from_hass(self):
+        """Unsubscribe from WebSocket updates."""
+        if self._unsub_dispatcher is not None:
+            self._unsub_dispatcher()
+            self._unsub_dispatcher = None
+        if self._pending_write_handle is not None:
+            self._pending_write_handle.cancel()
+            self._pending_write_handle = None
+
+    def _state_snapshot(self) -> tuple:
+        """Return the state fields that are written to Home Assistant."""
+        return (
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+            self._attr_hvac_mode,
+            self._attr_preset_mode,
+            self._attr_hvac_action,
+            self._attr_available,
+        )
+
+    @callback
+    def _flush_state(self):
+        """Write the coalesced state to Home Assistant."""
+        self._pending_write_handle = None
+        self.async_write_ha_state()
+
+    @callback
+    def _schedule_state_write(self):
+        """Schedule a coalesced state write unless one is already pending."""
+        if self._pending_write_handle is None:
+            self._pending_write_handle = self.hass.loop.call_later(
+                STATE_WRITE_DELAY, self._flush_state
+            )
 
+    @callback
     def _handle_update(self, state: dict):
         """Handle updates from WebSocket."""
-        _LOGGER.info("🔥 Climate entity received update for %s: %s", self.device_id, state)
-        if "temp" in state:
-            old_temp = self._attr_current_temperature
-            self._attr_current_temperature = state["temp"]
-            _LOGGER.info("🌡️ Temperature update: %s -> %s", old_temp, self._attr_current_temperature)
-        if "um_max_temp" in state:
-            old_target = self._attr_target_temperature
-            self._attr_target_temperature = state["um_max_temp"]
-            _LOGGER.info("🎯 Target temp update: %s -> %s", old_target, self._attr_target_temperature)
-        if "status" in state:
-            if state["status"] == "comfort":
-                self._attr_hvac_mode = HVACMode.HEAT
-                self._attr_preset_mode = PRESET_COMFORT
-                self._attr_hvac_action = HVACAction.HEATING
-            elif state["status"] == "eco":
-                self._attr_hvac_mode = HVACMode.HEAT
-                self._attr_preset_mode = PRESET_ECO
-                self._attr_hvac_action = HVACAction.HEATING
-            elif state["status"] == "ice":
-                self._attr_hvac_mode = HVACMode.OFF
-                self._attr_preset_mode = None
-                self._attr_hvac_action = HVACAction.OFF
-        self.async_write_ha_state()
+        before = self._state_snapshot()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Climate entity received update for %s: %s", self.device_id, state)
+        # Readings from an offline heater are stale, so don't decode them
+        online = state.get("online")
+        if online is not None:
+            self._attr_available = bool(online)
+            if not online:
+                if self._state_snapshot() != before:
+                    self._schedule_state_write()
+                return
+        temp = _decode_temp(state, "temp")
+        if temp is not None:
+            self._attr_current_temperature = temp
+        # Only the setpoint is bounded; measured room temperatures can be anything
+        target = _decode_temp(state, "um_max_temp")
+        if target is not None and MIN_TEMP <= target <= MAX_TEMP:
+            self._attr_target_temperature = target
+            self._target_known = True
+        mapped = _STATUS_MAP.get(state.get("status"))
+        if mapped is not None:
+            self._attr_hvac_mode, self._attr_preset_mode, self._attr_hvac_action = mapped
+            self._mode_known = True
+        if self._state_snapshot() != before:
+            self._schedule_state_write()
 
     async def async_set_hvac_mode(self, hvac_mode: str):
         await self.api.set_hvac_mode(self.device_id, hvac_mode)
@@ -108,6 +192,12 @@ class RointeHeater(ClimateEntity):
         await self.async_set_hvac_mode(HVACMode.OFF)
 
     async def async_set_preset_mode(self, preset_mode: str):
+        if (
+            self._mode_known
+            and preset_mode == self._attr_preset_mode
+            and self._attr_hvac_mode == HVACMode.HEAT
+        ):
+            return
         await self.api.set_preset_mode(self.device_id, preset_mode)
         self._attr_preset_mode = preset_mode
         self._attr_hvac_mode = HVACMode.HEAT
@@ -117,6 +207,8 @@ class RointeHeater(ClimateEntity):
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
+        if self._target_known and temperature == self._attr_target_temperature:
+            return
         await self.api.set_temperature(self.device_id, temperature)
         self._attr_target_temperature = temperature
-        self.async_write_ha_state()
\ No newline at end of file
+        self.async_write_ha_state()
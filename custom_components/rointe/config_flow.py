@@ -14,6 +14,7 @@ from homeassistant.core import HomeAssistant, callback
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN
 from .auth import RointeAuth, RointeRestAuthError, RointeFirebaseAuthError
@@ -116,13 +117,12 @@ class RointeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         
         try:
             # Create auth instance and validate credentials
-            auth = RointeAuth(email, password)
-            async with auth:
-                # Test REST API authentication
-                if not await auth.async_validate_credentials():
-                    raise InvalidAuth("Invalid email or password")
-                
-                _LOGGER.debug("Credentials validation successful for %s", email)
+            auth = RointeAuth(email, password, session=async_get_clientsession(self.hass))
+            # Test REST API authentication
+            if not await auth.async_validate_credentials():
+                raise InvalidAuth("Invalid email or password")
+            
+            _LOGGER.debug("Credentials validation successful for %s", email)
                 
         except RointeRestAuthError as e:
             _LOGGER.error("REST authentication failed: %s", e)
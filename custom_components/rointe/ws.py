@@ -20,12 +20,12 @@ FIREBASE_URL = "wss://s-gke-euw1-nssi3-8.europe-west1.firebasedatabase.app/.ws?v
 SIGNAL_UPDATE = "rointe_device_update"
 
 class RointeWebSocket:
-    def __init__(self, hass, auth):
-        """Initialize WebSocket client with dual authentication handler"""
+    def __init__(self, hass, auth, session: aiohttp.ClientSession):
+        """Initialize WebSocket client with dual authentication handler and Home Assistant's shared session"""
         self.hass = hass
         self.auth = auth
         self.ws = None
-        self.session = None
+        self.session = session
         self.running = False
         self.reconnect_task = None
         self.reconnect_attempts = 0
@@ -47,10 +47,6 @@ class RointeWebSocket:
             id_token = await self.auth.async_firebase_token()
             url = f"{FIREBASE_URL}&auth={id_token}"
             
-            # Create new session if needed
-            if self.session is None or self.session.closed:
-                self.session = aiohttp.ClientSession()
-            
             # Connect to WebSocket
             self.ws = await self.session.ws_connect(url)
             self.reconnect_attempts = 0  # Reset counter on successful connection
@@ -87,7 +83,7 @@ class RointeWebSocket:
             }
             
             await self.ws.send_str(json.dumps(subscription_msg))
-            _LOGGER.info("🔥 Sent subscription message to WebSocket")
+            _LOGGER.debug("Sent subscription message to WebSocket")
             
         except Exception as e:
             _LOGGER.error("Failed to subscribe to WebSocket updates: %s", e)
@@ -116,16 +112,16 @@ class RointeWebSocket:
         """Handle incoming WebSocket message."""
         try:
             data = json.loads(data)
-            _LOGGER.info("🔥 WebSocket message received: %s", data)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("WebSocket message received: %s", data)
             if "d" in data and isinstance(data["d"], dict):
                 payload = data["d"]
                 if "b" in payload and "p" in payload["b"]:
                     path = payload["b"]["p"]
-                    _LOGGER.info("🔥 WebSocket path: %s", path)
+                    _LOGGER.debug("WebSocket path: %s", path)
                     if path.startswith("devices/") and "/data" in path:
                         device_id = path.split("/")[1]
                         state = payload["b"].get("d", {})
-                        _LOGGER.info("🔥 Sending update to device %s: %s", device_id, state)
                         async_dispatcher_send(self.hass, f"{SIGNAL_UPDATE}_{device_id}", state)
                         _LOGGER.debug("Received update for device %s: %s", device_id, state)
         except json.JSONDecodeError as e:
@@ -205,7 +201,6 @@ class RointeWebSocket:
             }
             message = json.dumps(frame)
             await self.ws.send_str(message)
-            _LOGGER.info("🔥 SENT WebSocket message: %s", message)
             _LOGGER.debug("Sent update to device %s: %s", device_id, updates)
         except Exception as e:
             _LOGGER.error("Failed to send update to device %s: %s", device_id, e)
@@ -223,9 +218,4 @@ class RointeWebSocket:
         # Close WebSocket
         if self.ws and not self.ws.closed:
             await self.ws.close()
-            self.ws = None
-        
-        # Close session
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
\ No newline at end of file
+            self.ws = None
\ No newline at end of file